@@ -1,8 +1,18 @@
+import os
 import quickjs
 import requests
-from bs4 import BeautifulSoup
 import urllib3
-import json
+from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:  # orjson 不可用时回退到标准库 json
+    orjson = None
+    import json
+
+# 是否运行额外的诊断解析（默认关闭，不进入正常流程）
+DEBUG = bool(os.environ.get('FAST_READABILITY_DEBUG'))
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # 读取 JS 脚本
@@ -33,8 +43,9 @@ simple_test_js = """
 })()
 """
 
-simple_result = ctx.eval(simple_test_js)
-print("简单HTML测试:", simple_result)
+if DEBUG:
+    simple_result = ctx.eval(simple_test_js)
+    print("简单HTML测试:", simple_result)
 
 # 获取网页 HTML
 url = "https://1275.ru/ioc/kiberprestupniki-vzlomali-korporativnuyu-set-cherez-uyazvimost-v-confluence-s-posleduyuschim-razvertyvaniem-ransomware_11483"
@@ -44,7 +55,8 @@ headers = {
 html = requests.get(url, headers=headers, verify=False).text
 # html = open("test_ru.html", "r", encoding="utf-8").read()
 
-# 用 BeautifulSoup 预处理（可选）
+# 用 BeautifulSoup 预处理：删除 script 标签和 style 属性
+# JSDOMParser 要求空元素自闭合，bs4 重新序列化时会输出 <meta ... />，不能换成正则或其他解析器
 soup = BeautifulSoup(html, "html.parser")
 
 # 使用BeautifulSoup重新格式化HTML，确保结构正确
@@ -66,53 +78,62 @@ print("HTML长度:", len(html))
 print("清理后HTML开头:", repr(clean_html[:200]))
 print("清理后HTML结尾:", repr(clean_html[-200:]))
 
-# 构建 JS 执行代码（确保使用 JS 字符串语法）
-escaped_html = json.dumps(clean_html)  # 使用清理后的HTML（移除了script和style）
+# 通过全局变量把HTML交给 JS，脚本本身保持固定且很小（不随HTML大小增长）
+# 使用清理后的HTML（移除了script和style）
+ctx.set("__html__", clean_html)
 
 # 先检查解析是否正常
-debug_js = f"""
-(() => {{
+debug_js = """
+(() => {
     let parser = new JSDOMParser();
-    let doc = parser.parse({escaped_html});
+    let doc = parser.parse(__html__);
     
-    return JSON.stringify({{
+    return JSON.stringify({
         hasDoc: !!doc,
         hasDocumentElement: !!doc.documentElement,
         hasChildNodes: !!doc.childNodes,
         childNodesLength: doc.childNodes ? doc.childNodes.length : 0,
         childNodeNames: doc.childNodes ? doc.childNodes.map(n => n.nodeName) : []
-    }});
-}})()
+    });
+})()
 """
 
-debug_result = ctx.eval(debug_js)
-print("Debug info:", debug_result)
+if DEBUG:
+    debug_result = ctx.eval(debug_js)
+    print("Debug info:", debug_result)
 
 
-js_code = f"""
-(() => {{
+js_code = """
+(() => {
     let parser = new JSDOMParser();
-    let doc = parser.parse({escaped_html});
+    let doc = parser.parse(__html__);
     
     // 如果没有documentElement，但有childNodes，手动设置documentElement
-    if (!doc.documentElement && doc.childNodes && doc.childNodes.length > 0) {{
-        for (let i = 0; i < doc.childNodes.length; i++) {{
-            if (doc.childNodes[i].nodeName === 'HTML') {{
+    if (!doc.documentElement && doc.childNodes && doc.childNodes.length > 0) {
+        for (let i = 0; i < doc.childNodes.length; i++) {
+            if (doc.childNodes[i].nodeName === 'HTML') {
                 doc.documentElement = doc.childNodes[i];
                 break;
-            }}
-        }}
-    }}
+            }
+        }
+    }
     
     let reader = new Readability(doc);
-    let article = reader.parse();
-    return JSON.stringify(article);
-}})()
+    globalThis.__r = reader.parse();
+})()
 """
 
-# 执行并返回结果
-result_json = ctx.eval(js_code)
-result = json.loads(result_json)
+# 执行并返回结果：只序列化体积小的元数据，大字段直接以 JS 字符串读取
+ctx.eval(js_code)
+meta_json = ctx.eval("""
+JSON.stringify(__r && {
+    title: __r.title, byline: __r.byline, dir: __r.dir, lang: __r.lang,
+    excerpt: __r.excerpt, siteName: __r.siteName, length: __r.length
+})
+""")
+result = orjson.loads(meta_json) if orjson is not None else json.loads(meta_json)
+result["content"] = ctx.eval("__r.content")
+result["textContent"] = ctx.eval("__r.textContent")
 
 # 输出标题与正文
 print("标题:", result["title"])
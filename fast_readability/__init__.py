@@ -4,7 +4,31 @@ Fast Readability - A fast HTML content extractor based on Mozilla's Readability.
 This package provides a simple interface to extract clean article content from HTML.
 """
 
-from .readability import Readability, extract_content
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .readability import (
+        Readability,
+        aextract_from_url,
+        aextract_from_urls,
+        extract_content,
+        extract_from_url,
+    )
 
 __version__ = "0.1.0"
-__all__ = ["Readability", "extract_content"] 
\ No newline at end of file
+__all__ = [
+    "Readability",
+    "extract_content",
+    "extract_from_url",
+    "aextract_from_url",
+    "aextract_from_urls",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # 延迟导入，避免 `import fast_readability` 时就加载 quickjs、bs4 和 requests
+    if name in __all__:
+        from . import readability
+
+        return getattr(readability, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,217 @@
+"""
+Pool of warm QuickJS contexts with JSDOMParser.js and Readability.js loaded
+"""
+
+import os
+import threading
+import quickjs
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+
+_JS_DIR = os.path.join(os.path.dirname(__file__), "js")
+
+# 每个线程最多保留的空闲上下文数量
+MAX_IDLE_CONTEXTS = 4
+
+# QuickJS 运行时即使不并发，被多个线程先后访问也可能崩溃，因此按线程分池
+_local = threading.local()
+
+# 已取出上下文的所属线程，以 id(ctx) 为键（quickjs.Context 不支持属性和弱引用）
+_owners: Dict[int, int] = {}
+_owners_lock = threading.Lock()
+
+# 在 Readability.js 之上定义的辅助函数
+_HELPERS_JS = """
+function __fastReadabilityParseDocument(html) {
+    let doc = new JSDOMParser().parse(html);
+
+    // 如果没有documentElement，但有childNodes，手动设置documentElement
+    if (!doc.documentElement && doc.childNodes && doc.childNodes.length > 0) {
+        for (let i = 0; i < doc.childNodes.length; i++) {
+            if (doc.childNodes[i].nodeName === 'HTML') {
+                doc.documentElement = doc.childNodes[i];
+                break;
+            }
+        }
+    }
+    return doc;
+}
+
+function __fastReadabilityParse(html) {
+    let doc = __fastReadabilityParseDocument(html);
+    return new Readability(doc).parse();
+}
+
+// 只序列化体积小的元数据字段，content/textContent 直接以字符串读取
+function __fastReadabilityMetadata(article) {
+    return JSON.stringify({
+        title: article.title,
+        byline: article.byline,
+        dir: article.dir,
+        lang: article.lang,
+        length: article.length,
+        excerpt: article.excerpt,
+        siteName: article.siteName,
+        publishedTime: article.publishedTime,
+    });
+}
+
+function __fastReadabilityField(article, name) {
+    return article[name];
+}
+
+// 只执行 parse() 中元数据提取之前的步骤，跳过正文评分与序列化
+function __fastReadabilityTitle(html) {
+    let doc = __fastReadabilityParseDocument(html);
+    let reader = new Readability(doc);
+    reader._unwrapNoscriptImages(doc);
+    let jsonLd = reader._disableJSONLD ? {} : reader._getJSONLD(doc);
+    reader._removeScripts(doc);
+    reader._prepDocument();
+    return reader._getArticleMetadata(jsonLd).title || "";
+}
+
+// 只需要纯文本时跳过正文HTML的序列化
+function __fastReadabilityText(html) {
+    let doc = __fastReadabilityParseDocument(html);
+    let article = new Readability(doc, { serializer: () => "" }).parse();
+    return article ? article.textContent : "";
+}
+
+// 移植自 Mozilla Readability-readerable.js 的 isProbablyReaderable，
+// 改用 JSDOMParser 支持的 DOM 接口（没有 querySelectorAll/matches）
+function __fastReadabilityIsProbablyReaderable(html, minContentLength) {
+    let doc = __fastReadabilityParseDocument(html);
+    let regexps = Readability.prototype.REGEXPS;
+    let isVisible = Readability.prototype._isProbablyVisible;
+    let minScore = 20;
+
+    let nodes = new Set();
+    for (let tag of ["p", "pre", "article"]) {
+        for (let node of doc.getElementsByTagName(tag)) {
+            nodes.add(node);
+        }
+    }
+    // 包含 <br> 的 <div> 也可能是正文段落
+    for (let br of doc.getElementsByTagName("br")) {
+        if (br.parentNode && br.parentNode.localName === "div") {
+            nodes.add(br.parentNode);
+        }
+    }
+
+    let score = 0;
+    for (let node of nodes) {
+        if (!isVisible(node)) {
+            continue;
+        }
+
+        let matchString = node.className + " " + node.id;
+        if (regexps.unlikelyCandidates.test(matchString) &&
+            !regexps.okMaybeItsACandidate.test(matchString)) {
+            continue;
+        }
+
+        // 等价于 node.matches("li p")
+        if (node.localName === "p") {
+            let inListItem = false;
+            for (let p = node.parentNode; p; p = p.parentNode) {
+                if (p.localName === "li") {
+                    inListItem = true;
+                    break;
+                }
+            }
+            if (inListItem) {
+                continue;
+            }
+        }
+
+        let textContentLength = node.textContent.trim().length;
+        if (textContentLength < minContentLength) {
+            continue;
+        }
+
+        score += Math.sqrt(textContentLength - minContentLength);
+        if (score > minScore) {
+            return true;
+        }
+    }
+    return false;
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def _load_js_sources() -> Tuple[str, str]:
+    """
+    Read JSDOMParser.js and Readability.js once per process.
+
+    The quickjs bindings do not expose bytecode serialization, so the
+    source text is cached instead and every new context evaluates it
+    without touching the filesystem again.
+
+    Returns:
+        Tuple[str, str]: (JSDOMParser source, Readability source)
+    """
+    with open(os.path.join(_JS_DIR, "JSDOMParser.js"), "r", encoding="utf-8") as f:
+        js_dom_parser = f.read()
+    with open(os.path.join(_JS_DIR, "Readability.js"), "r", encoding="utf-8") as f:
+        js_readability = f.read()
+    return js_dom_parser, js_readability
+
+
+def _new_context() -> quickjs.Context:
+    """Create a QuickJS context with the Readability globals installed."""
+    js_dom_parser, js_readability = _load_js_sources()
+    ctx = quickjs.Context()
+    ctx.eval(js_dom_parser)
+    ctx.eval(js_readability)
+    ctx.eval(_HELPERS_JS)
+    return ctx
+
+
+def _idle_contexts() -> List[quickjs.Context]:
+    """Return the calling thread's stack of idle contexts."""
+    idle = getattr(_local, "idle", None)
+    if idle is None:
+        idle = _local.idle = []
+    return idle
+
+
+def checkout() -> quickjs.Context:
+    """
+    Take a warm context from the calling thread's pool, creating one if
+    none is idle.
+
+    The caller owns the context exclusively until it is passed back to
+    `checkin`; quickjs.Context is not safe to share between threads.
+
+    Returns:
+        quickjs.Context: Context with JSDOMParser and Readability defined
+    """
+    idle = _idle_contexts()
+    ctx = idle.pop() if idle else _new_context()
+    with _owners_lock:
+        _owners[id(ctx)] = threading.get_ident()
+    return ctx
+
+
+def checkin(ctx: quickjs.Context) -> None:
+    """
+    Return a context to the calling thread's pool, dropping it if the
+    pool is full or the context was checked out on another thread.
+
+    Args:
+        ctx (quickjs.Context): Context previously obtained from `checkout`
+    """
+    with _owners_lock:
+        owner = _owners.pop(id(ctx), None)
+    if owner != threading.get_ident():
+        # 其他线程取出的上下文不能进入本线程的池
+        return
+    
+    idle = _idle_contexts()
+    if len(idle) < MAX_IDLE_CONTEXTS:
+        # 回收上次解析留下的 DOM 对象，避免空闲上下文占用内存
+        ctx.gc()
+        idle.append(ctx)
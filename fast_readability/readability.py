@@ -2,12 +2,58 @@
 Fast Readability - HTML content extractor
 """
 
-import os
+import asyncio
+import functools
 import json
-import quickjs
+import threading
 from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Sequence, Union
 
+from . import _pool
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，不可用时回退到标准库 json
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+class _ResultCache:
+    """
+    Thread-safe LRU of extraction results keyed by the input HTML.
+
+    The HTML string itself is the key: str caches its hash, so lookups do
+    not re-encode the document, at the cost of keeping up to `maxsize`
+    inputs alive alongside their results.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, html: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get(html)
+            if result is None:
+                return None
+            self._entries.move_to_end(html)
+        # 返回副本，调用方修改结果不会污染缓存
+        return dict(result)
+    
+    def put(self, html: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[html] = dict(result)
+            self._entries.move_to_end(html)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
 
 class Readability:
@@ -16,39 +62,52 @@ class Readability:
     
     This class provides methods to extract clean article content from HTML,
     either from a URL or from HTML strings directly.
+
+    Instances borrow a pre-initialized JavaScript context from a shared
+    pool. Use the extractor as a context manager (or call `close`) to hand
+    the context back for reuse.
     """
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, memory_limit: Optional[int] = None,
+                 cache_size: int = 0):
         """
         Initialize the Readability extractor.
         
         Args:
             debug (bool): Enable debug mode for detailed loggings
+            memory_limit (Optional[int]): Maximum JavaScript heap size in bytes,
+                unlimited if None
+            cache_size (int): Number of recent `extract_from_html` results to
+                keep per instance, disabled if 0
         """
         self.debug = debug
+        self.memory_limit = memory_limit
+        self._cache = _ResultCache(cache_size) if cache_size > 0 else None
         self._js_context = None
+        self._parse_js = None
+        self._metadata_js = None
+        self._field_js = None
+        self._title_js = None
+        self._text_js = None
+        self._readerable_js = None
         self._initialize_js_context()
     
     def _initialize_js_context(self):
         """Initialize the JavaScript context with required libraries."""
         try:
-            # 获取JS文件路径
-            package_dir = os.path.dirname(__file__)
-            js_dir = os.path.join(package_dir, "js")
-            
-            jsdom_parser_path = os.path.join(js_dir, "JSDOMParser.js")
-            readability_path = os.path.join(js_dir, "Readability.js")
+            # 从池中获取已加载 JSDOMParser/Readability 的JS执行器
+            self._js_context = _pool.checkout()
+            self._js_context.set_memory_limit(
+                self.memory_limit if self.memory_limit is not None else -1
+            )
             
-            # 读取JS脚本
-            with open(jsdom_parser_path, "r", encoding="utf-8") as f:
-                js_dom_parser = f.read()
-            with open(readability_path, "r", encoding="utf-8") as f:
-                js_readability = f.read()
-            
-            # 初始化JS执行器
-            self._js_context = quickjs.Context()
-            self._js_context.eval(js_dom_parser)
-            self._js_context.eval(js_readability)
+            # 绑定一次JS函数，HTML作为参数传入而不是拼接进JS源码
+            self._parse_js = self._js_context.get("__fastReadabilityParse")
+            self._metadata_js = self._js_context.get("__fastReadabilityMetadata")
+            self._field_js = self._js_context.get("__fastReadabilityField")
+            self._title_js = self._js_context.get("__fastReadabilityTitle")
+            self._text_js = self._js_context.get("__fastReadabilityText")
+            self._readerable_js = self._js_context.get("__fastReadabilityIsProbablyReaderable")
             
             if self.debug:
                 print("JavaScript context initialized successfully")
@@ -56,6 +115,24 @@ class Readability:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize JavaScript context: {e}")
     
+    def close(self):
+        """Return the JavaScript context to the shared pool."""
+        if self._js_context is not None:
+            self._parse_js = None
+            self._metadata_js = None
+            self._field_js = None
+            self._title_js = None
+            self._text_js = None
+            self._readerable_js = None
+            _pool.checkin(self._js_context)
+            self._js_context = None
+    
+    def __enter__(self) -> "Readability":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _clean_html(self, html: str) -> str:
         """
         Clean HTML by removing script tags and style attributes.
@@ -95,55 +172,59 @@ class Readability:
         Returns:
             Dict[str, Any]: Extracted article data
         """
+        # 相同HTML的提取结果相同，命中缓存时无需进入JS
+        if self._cache is not None:
+            cached = self._cache.get(html)
+            if cached is not None:
+                if self.debug:
+                    print("Returning cached extraction result")
+                return cached
+        
+        if self._js_context is None:
+            self._initialize_js_context()
+        
         try:
             # 清理HTML
             clean_html = self._clean_html(html)
             
-            # 转义HTML字符串用于JavaScript
-            escaped_html = json.dumps(clean_html)
-            
-            # 构建JavaScript执行代码
-            js_code = f"""
-            (() => {{
-                let parser = new JSDOMParser();
-                let doc = parser.parse({escaped_html});
-                
-                // 如果没有documentElement，但有childNodes，手动设置documentElement
-                if (!doc.documentElement && doc.childNodes && doc.childNodes.length > 0) {{
-                    for (let i = 0; i < doc.childNodes.length; i++) {{
-                        if (doc.childNodes[i].nodeName === 'HTML') {{
-                            doc.documentElement = doc.childNodes[i];
-                            break;
-                        }}
-                    }}
-                }}
-                
-                let reader = new Readability(doc);
-                let article = reader.parse();
-                return JSON.stringify(article);
-            }})()
-            """
-            
-            # 执行JavaScript并获取结果
-            result_json = self._js_context.eval(js_code)
-            result = json.loads(result_json)
+            # 执行JavaScript，结果对象留在JS中
+            article = self._parse_js(clean_html)
+            if article is None:
+                result = self._empty_result()
+            else:
+                # 元数据走JSON，大字段直接作为字符串读取，避免整篇文章的序列化往返
+                result = _json_loads(self._metadata_js(article))
+                result["content"] = self._field_js(article, "content")
+                result["textContent"] = self._field_js(article, "textContent")
             
+            if self._cache is not None:
+                self._cache.put(html, result)
             return result
             
         except Exception as e:
             if self.debug:
                 print(f"Content extraction failed: {e}")
-            return {
-                "title": "",
-                "content": "",
-                "textContent": "",
-                "length": 0,
-                "excerpt": "",
-                "byline": "",
-                "dir": "",
-                "siteName": "",
-                "lang": ""
-            }
+            return self._empty_result()
+    
+    def clear_cache(self) -> None:
+        """Drop this instance's cached extraction results."""
+        if self._cache is not None:
+            self._cache.clear()
+    
+    @staticmethod
+    def _empty_result() -> Dict[str, Any]:
+        """Result returned when no article could be extracted."""
+        return {
+            "title": "",
+            "content": "",
+            "textContent": "",
+            "length": 0,
+            "excerpt": "",
+            "byline": "",
+            "dir": "",
+            "siteName": "",
+            "lang": ""
+        }
     
     def extract_from_html(self, html: str) -> Dict[str, Any]:
         """
@@ -166,53 +247,200 @@ class Readability:
         """
         return self._extract_content(html)
     
+    def extract_many(self, htmls: Sequence[str],
+                     max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract article content from several HTML strings.
+        
+        By default the documents are processed one after another on this
+        instance. The quickjs bindings hold the GIL while JavaScript runs,
+        so threads cannot speed this up; with `max_workers` > 1 the work is
+        spread over worker processes instead, each configured like this
+        instance. Process startup costs more than a small batch saves, so
+        this only pays off for many large documents.
+        
+        Args:
+            htmls (Sequence[str]): HTML strings to process
+            max_workers (Optional[int]): Number of worker processes; the
+                documents are processed in this process if None or 1
+            
+        Returns:
+            List[Dict[str, Any]]: Extracted article data, in input order
+        """
+        if len(htmls) <= 1 or max_workers is None or max_workers <= 1:
+            return [self.extract_from_html(html) for html in htmls]
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.debug, self.memory_limit),
+        ) as executor:
+            return list(executor.map(_extract_in_worker, htmls))
     
     def get_text_content(self, html: str) -> str:
         """
         Get plain text content from HTML.
         
+        The article HTML is never serialized on this path, since only the
+        text is returned.
+        
         Args:
             html (str): HTML string to process
             
         Returns:
             str: Extracted plain text content
         """
-        result = self.extract_from_html(html)
-        return result.get("textContent", "")
+        if self._js_context is None:
+            self._initialize_js_context()
+        
+        try:
+            return self._text_js(self._clean_html(html))
+        except Exception as e:
+            if self.debug:
+                print(f"Text extraction failed: {e}")
+            return ""
     
     def get_title(self, html: str) -> str:
         """
         Get article title from HTML.
         
+        Only the metadata step of Readability.js runs, so this is much
+        cheaper than a full `extract_from_html` call. The title is the same
+        one `extract_from_html` reports, except when no article content is
+        found: `extract_from_html` then returns an empty result, while this
+        still returns the document's title.
+        
         Args:
             html (str): HTML string to process
             
         Returns:
             str: Extracted article title
         """
-        result = self.extract_from_html(html)
-        return result.get("title", "")
+        if self._js_context is None:
+            self._initialize_js_context()
+        
+        try:
+            return self._title_js(self._clean_html(html))
+        except Exception as e:
+            if self.debug:
+                print(f"Title extraction failed: {e}")
+            return ""
     
     def is_probably_readable(self, html: str, min_content_length: int = 140) -> bool:
         """
         Check if the HTML contains readable content.
         
+        Uses the isProbablyReaderable heuristic from Readability.js, which
+        only scores paragraph-like nodes and does not run a full extraction.
+        
         Args:
             html (str): HTML string to check
-            min_content_length (int): Minimum content length to consider readable
+            min_content_length (int): Minimum text length of a paragraph to
+                count towards the readability score
             
         Returns:
             bool: True if the content is probably readable
         """
-        result = self.extract_from_html(html)
-        content_length = result.get("length", 0)
-        return content_length >= min_content_length
+        # 任何段落的文本都不会比原始HTML更长，HTML太短时无需进入JS
+        # （JS 的 length 按 UTF-16 码元计数，不小于 len()，只有很短的输入才需要编码计算）
+        if (isinstance(html, str) and len(html) < min_content_length
+                and len(html.encode("utf-16-le")) // 2 < min_content_length):
+            return False
+        
+        if self._js_context is None:
+            self._initialize_js_context()
+        
+        try:
+            return bool(self._readerable_js(self._clean_html(html), min_content_length))
+        except Exception as e:
+            if self.debug:
+                print(f"Readability check failed: {e}")
+            return False
+
+
+# 便捷函数共用的默认实例；QuickJS 上下文不能跨线程使用，因此每个线程一个
+_default = threading.local()
+
+
+def _get_default_reader() -> Readability:
+    """Return the calling thread's shared Readability instance."""
+    reader = getattr(_default, "reader", None)
+    if reader is None:
+        reader = _default.reader = Readability()
+    return reader
+
+
+# 工作进程内的 Readability 实例，由 _init_worker 按调用方实例的配置创建
+_worker_reader: Optional[Readability] = None
+
+
+def _init_worker(debug: bool, memory_limit: Optional[int]) -> None:
+    """Create the worker process's Readability instance."""
+    global _worker_reader
+    _worker_reader = Readability(debug=debug, memory_limit=memory_limit)
+
+
+def _extract_in_worker(html: str) -> Dict[str, Any]:
+    """Extract content in a worker process."""
+    return _worker_reader.extract_from_html(html)
+
+
+# 共享的 HTTP 会话，复用连接池避免每个 URL 重新握手
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> Any:
+    """Return the shared requests session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=2, backoff_factor=0.2),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def extract_from_url(url: str, debug: bool = False, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Convenience function to fetch a URL and extract its content.
+    
+    Requests go through one shared session, so repeated calls to the same
+    host reuse open connections.
+    
+    Args:
+        url (str): URL of the page to fetch
+        debug (bool): Enable debug mode
+        **kwargs: Extra arguments for `requests.Session.get`, such as
+            headers or timeout (defaults to 30 seconds)
+        
+    Returns:
+        Dict[str, Any]: Extracted article data
+    """
+    kwargs.setdefault("timeout", 30)
+    response = _get_session().get(url, **kwargs)
+    response.raise_for_status()
+    return extract_content(response.text, debug=debug)
 
 
 def extract_content(html: str, debug: bool = False) -> Dict[str, Any]:
     """
     Convenience function to extract content from HTML.
     
+    Calls reuse one long-lived Readability instance per thread. Construct
+    `Readability()` directly if an isolated extractor is needed.
+    
     Args:
         html (str): HTML string to process
         debug (bool): Enable debug mode
@@ -220,5 +448,73 @@ def extract_content(html: str, debug: bool = False) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Extracted article data
     """
-    readability = Readability(debug=debug)
-    return readability.extract_from_html(html)
\ No newline at end of file
+    if debug:
+        with Readability(debug=True) as readability:
+            return readability.extract_from_html(html)
+    return _get_default_reader().extract_from_html(html)
+
+
+async def aextract_from_url(url: str, debug: bool = False, session: Any = None,
+                            **kwargs: Any) -> Dict[str, Any]:
+    """
+    Asynchronously fetch a URL with aiohttp and extract its content.
+    
+    The JavaScript extraction runs in the event loop's default executor,
+    so other downloads keep progressing while a page is parsed.
+    
+    Args:
+        url (str): URL of the page to fetch
+        debug (bool): Enable debug mode
+        session (Optional[aiohttp.ClientSession]): Session to reuse; a
+            temporary one is created if None
+        **kwargs: Extra arguments for `aiohttp.ClientSession.get`, such as
+            headers or timeout (defaults to 30 seconds)
+        
+    Returns:
+        Dict[str, Any]: Extracted article data
+    """
+    import aiohttp
+    
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await aextract_from_url(url, debug=debug, session=session, **kwargs)
+    
+    kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=30))
+    async with session.get(url, **kwargs) as response:
+        response.raise_for_status()
+        html = await response.text()
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(extract_content, html, debug))
+
+
+async def aextract_from_urls(urls: Sequence[str], max_concurrency: int = 32,
+                             debug: bool = False,
+                             **kwargs: Any) -> List[Union[Dict[str, Any], BaseException]]:
+    """
+    Asynchronously fetch several URLs and extract their content.
+    
+    A failing URL does not abort the batch: its exception (for example
+    `aiohttp.ClientResponseError` for a 404) is returned in its place.
+    
+    Args:
+        urls (Sequence[str]): URLs of the pages to fetch
+        max_concurrency (int): Maximum number of requests in flight
+        debug (bool): Enable debug mode
+        **kwargs: Extra arguments for `aiohttp.ClientSession.get`
+        
+    Returns:
+        List[Union[Dict[str, Any], BaseException]]: Extracted article data
+            or the raised exception for each URL, in input order
+    """
+    import aiohttp
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async with aiohttp.ClientSession() as session:
+        async def fetch_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await aextract_from_url(url, debug=debug, session=session, **kwargs)
+        
+        return list(await asyncio.gather(*(fetch_one(url) for url in urls),
+                                         return_exceptions=True))
@@ -35,6 +35,12 @@ setup(
         "urllib3",
     ],
     extras_require={
+        "speedups": [
+            "orjson",
+        ],
+        "async": [
+            "aiohttp",
+        ],
         "dev": [
             "pytest",
             "black",
@@ -5,78 +5,342 @@
 
 import sys
 import os
+import io
+import asyncio
+import threading
+from contextlib import redirect_stdout
+from functools import lru_cache
 
 # 添加当前目录到路径，以便导入本地包
 sys.path.insert(0, os.path.dirname(__file__))
 
+
+@lru_cache(maxsize=None)
+def shared_reader():
+    """
+    所有测试共用的 Readability 实例，避免每个测试重复初始化JS上下文
+
+    缓存按进程保存，使用 pytest-xdist（pytest -n auto）时每个 worker 进程各自创建一个实例
+    """
+    from fast_readability import Readability
+    return Readability()
+
+
+def has_result_shape(result):
+    """检查提取结果是否为包含 title/content 的字典"""
+    return isinstance(result, dict) and result.get('title') is not None and result.get('content') is not None
+
+
+# 测试用HTML，定义为模块常量以便各测试共用
+ARTICLE_HTML = """
+<html>
+<head><title>测试标题</title></head>
+<body>
+    <article>
+        <h1>测试文章</h1>
+        <p>这是一段测试内容，用于验证HTML内容提取功能是否正常工作。</p>
+        <p>这里是第二段内容，增加一些文字以确保内容长度足够。</p>
+    </article>
+</body>
+</html>
+"""
+
+_PARAGRAPHS = "".join(f"<p>{'这是一段足够长的正文内容。' * 20}</p>" for _ in range(3))
+READABLE_HTML = f"<html><head><title>可读</title></head><body><article>{_PARAGRAPHS}</article></body></html>"
+NON_READABLE_HTML = "<html><body><p>太短了</p></body></html>"
+
+# 正文中出现未转义的 "<"，不能被当作标签开头而丢掉后面的文本
+BARE_LT_HTML = f"<html><body><article>{_PARAGRAPHS.replace('<p>', '<p>a < b ')}</article></body></html>"
+
+# (HTML, 期望的可读性检查结果)
+READABILITY_CASES = [
+    (READABLE_HTML, True),
+    (NON_READABLE_HTML, False),
+    (BARE_LT_HTML, True),
+    # bytes 输入由 BeautifulSoup 解码
+    (READABLE_HTML.encode("utf-8"), True),
+]
+
+INVALID_HTML = "<<invalid>>html<<"
+
+TITLE_ONLY_HTML = "<html><head><title>Only title</title></head><body></body></html>"
+
+URL_HTML = "<html><head><title>URL测试</title></head><body><p>测试内容</p></body></html>"
+
+
+class MockResponse:
+    """模拟 requests 响应，返回固定的HTML"""
+
+    def __init__(self, text=URL_HTML):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+class MockSession:
+    """模拟 requests.Session，记录最近一次请求的参数，不访问网络"""
+
+    def __init__(self, text=URL_HTML):
+        self.text = text
+        self.kwargs = None
+
+    def get(self, url, **kwargs):
+        self.kwargs = kwargs
+        return MockResponse(self.text)
+
+
 def test_import():
     """测试包导入"""
-    try:
-        from fast_readability import Readability, extract_content
-        print("✓ 包导入成功")
-        return True
-    except ImportError as e:
-        print(f"✗ 包导入失败: {e}")
-        return False
+    from fast_readability import Readability, extract_content
+    print("✓ 包导入成功")
 
 def test_basic_functionality():
-    """测试基本功能"""
-    try:
-        from fast_readability import Readability
-        
-        # 简单的HTML测试
-        html = """
-        <html>
-        <head><title>测试标题</title></head>
-        <body>
-            <article>
-                <h1>测试文章</h1>
-                <p>这是一段测试内容，用于验证HTML内容提取功能是否正常工作。</p>
-                <p>这里是第二段内容，增加一些文字以确保内容长度足够。</p>
-            </article>
-        </body>
-        </html>
-        """
-        
-        reader = Readability(debug=True)
-        result = reader.extract_from_html(html)
-        
-        if result['title']:
-            print(f"✓ 标题提取成功: {result['title']}")
-        else:
-            print("✗ 标题提取失败")
-            return False
-            
-        if result['textContent']:
-            print(f"✓ 内容提取成功: {len(result['textContent'])} 字符")
-        else:
-            print("✗ 内容提取失败")
-            return False
-            
-        return True
-        
-    except Exception as e:
-        print(f"✗ 基本功能测试失败: {e}")
-        return False
+    """测试基本功能（调试模式）"""
+    from fast_readability import Readability
+    
+    output = io.StringIO()
+    with redirect_stdout(output):
+        with Readability(debug=True) as reader:
+            result = reader.extract_from_html(ARTICLE_HTML)
+    
+    assert "JavaScript context initialized successfully" in output.getvalue(), "调试模式未输出初始化信息"
+    
+    assert result['title'], "标题提取失败"
+    print(f"✓ 标题提取成功: {result['title']}")
+    
+    assert result['textContent'], "内容提取失败"
+    print(f"✓ 内容提取成功: {len(result['textContent'])} 字符")
 
 def test_utility_functions():
     """测试实用函数"""
-    try:
-        from fast_readability import extract_content
+    from fast_readability import extract_content
+    
+    html = "<html><head><title>实用函数测试</title></head><body><p>测试内容</p></body></html>"
+    result = extract_content(html)
+    
+    assert has_result_shape(result) and result['title'], "便捷函数测试失败"
+    print("✓ 便捷函数测试成功")
+
+def test_get_title():
+    """测试标题提取"""
+    reader = shared_reader()
+    
+    assert reader.get_title(ARTICLE_HTML) == reader.extract_from_html(ARTICLE_HTML)['title'], "标题与完整提取不一致"
+    
+    # 没有正文时完整提取返回空结果，get_title 仍返回文档标题
+    assert reader.extract_from_html(TITLE_ONLY_HTML)['title'] == "", "无正文时应返回空结果"
+    assert reader.get_title(TITLE_ONLY_HTML) == "Only title", "无正文时标题提取失败"
+    print("✓ 标题提取成功")
+
+
+def test_get_text_content():
+    """测试纯文本提取"""
+    reader = shared_reader()
+    
+    for html in (ARTICLE_HTML, READABLE_HTML, TITLE_ONLY_HTML):
+        assert reader.get_text_content(html) == reader.extract_from_html(html)['textContent'], "纯文本与完整提取不一致"
+    print("✓ 纯文本提取成功")
+
+
+def test_is_probably_readable():
+    """测试可读性检查"""
+    reader = shared_reader()
+    
+    for html, expected in READABILITY_CASES:
+        assert reader.is_probably_readable(html) is expected, f"可读性检查失败: 期望 {expected}"
+    print("✓ 可读性检查成功")
+
+
+def test_invalid_html():
+    """测试无效HTML不抛出异常（复用共享实例，不额外创建JS上下文）"""
+    reader = shared_reader()
+    
+    for html in ("", INVALID_HTML):
+        assert has_result_shape(reader.extract_from_html(html)), "无效HTML处理失败"
+    assert not reader.is_probably_readable(INVALID_HTML), "无效HTML不应判定为可读"
+    print("✓ 无效HTML处理成功")
+
+
+def test_result_cache():
+    """测试提取结果缓存的命中、副本隔离与清空"""
+    from fast_readability import Readability
+    
+    def extract(reader, html):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = reader.extract_from_html(html)
+        return result, "Returning cached" in output.getvalue()
+    
+    with Readability(debug=True, cache_size=2) as reader:
+        first, hit = extract(reader, ARTICLE_HTML)
+        assert not hit, "首次提取不应命中缓存"
+        first['title'] = "已修改"
         
-        html = "<html><head><title>实用函数测试</title></head><body><p>测试内容</p></body></html>"
-        result = extract_content(html)
+        second, hit = extract(reader, ARTICLE_HTML)
+        assert hit, "相同HTML未命中缓存"
+        assert second['title'] == "测试标题", "修改返回结果污染了缓存"
         
-        if result and result.get('title'):
-            print("✓ 便捷函数测试成功")
-            return True
-        else:
-            print("✗ 便捷函数测试失败")
-            return False
-            
-    except Exception as e:
-        print(f"✗ 便捷函数测试失败: {e}")
-        return False
+        reader.clear_cache()
+        _, hit = extract(reader, ARTICLE_HTML)
+        assert not hit, "clear_cache 后仍命中缓存"
+    
+    with Readability(debug=True) as reader:
+        reader.extract_from_html(ARTICLE_HTML)
+        _, hit = extract(reader, ARTICLE_HTML)
+        assert not hit, "默认不应缓存结果"
+    print("✓ 结果缓存测试成功")
+
+
+def test_memory_limit():
+    """测试JS内存上限，以及上下文归还后限制被重置"""
+    from fast_readability import Readability
+    
+    with Readability(memory_limit=100_000) as reader:
+        limited_ctx = reader._js_context
+        assert reader.extract_from_html(READABLE_HTML)['length'] == 0, "内存上限未生效"
+    
+    # 池中的上下文被下一个实例取出时应恢复为不限制
+    with Readability() as reader:
+        assert reader._js_context is limited_ctx, "上下文未被复用"
+        assert reader.extract_from_html(READABLE_HTML)['length'] > 0, "内存上限未被重置"
+    print("✓ 内存上限测试成功")
+
+
+def test_context_pool():
+    """测试JS上下文池复用"""
+    from fast_readability import Readability
+    
+    html = "<html><head><title>上下文池测试</title></head><body><p>测试内容</p></body></html>"
+    
+    with Readability() as reader:
+        first_ctx = reader._js_context
+        reader.extract_from_html(html)
+    
+    with Readability() as reader:
+        assert reader._js_context is first_ctx, "上下文未被复用"
+        assert reader.extract_from_html(html).get('title'), "复用上下文提取失败"
+    print("✓ 上下文池复用成功")
+
+def test_context_pool_thread_affinity():
+    """测试在其他线程归还的上下文不会被该线程复用"""
+    from fast_readability import Readability
+    
+    reader = Readability()
+    main_ctx = reader._js_context
+    worker_ctxs = []
+    
+    def close_and_reuse():
+        reader.close()
+        with Readability() as worker_reader:
+            worker_ctxs.append(worker_reader._js_context)
+    
+    thread = threading.Thread(target=close_and_reuse)
+    thread.start()
+    thread.join()
+    
+    assert worker_ctxs and worker_ctxs[0] is not main_ctx, "其他线程复用了主线程的上下文"
+    with Readability() as reader:
+        assert reader._js_context is not main_ctx, "跨线程归还的上下文回到了主线程的池"
+    print("✓ 上下文线程隔离成功")
+
+
+def test_extract_many():
+    """测试批量提取"""
+    from fast_readability import Readability
+    
+    htmls = [
+        f"<html><head><title>批量测试{i}</title></head><body><p>测试内容{i}</p></body></html>"
+        for i in range(4)
+    ]
+    expected = [f"批量测试{i}" for i in range(4)]
+    
+    reader = shared_reader()
+    assert [r.get('title') for r in reader.extract_many(htmls)] == expected, "顺序批量提取失败"
+    
+    parallel_htmls = [html + "<!-- 并行 -->" for html in htmls]
+    assert [r.get('title') for r in reader.extract_many(parallel_htmls, max_workers=2)] == expected, "并行批量提取失败"
+    
+    # 工作进程应沿用调用方实例的配置
+    limited_htmls = [html + "<!-- 内存限制 -->" for html in htmls]
+    with Readability(memory_limit=100_000) as limited:
+        results = limited.extract_many(limited_htmls, max_workers=2)
+    assert all(r['length'] == 0 for r in results), "工作进程未使用实例的内存限制"
+    print("✓ 批量提取成功")
+
+def test_extract_from_url():
+    """测试从URL提取（使用模拟会话，不访问网络）"""
+    from fast_readability import readability
+    
+    session = MockSession()
+    original_get_session = readability._get_session
+    readability._get_session = lambda: session
+    try:
+        result = readability.extract_from_url("https://example.com/article")
+    finally:
+        readability._get_session = original_get_session
+    
+    assert result.get('title') == "URL测试", "URL提取失败"
+    assert session.kwargs.get('timeout') == 30, "默认超时未设置"
+    print("✓ URL提取成功")
+
+
+def test_aextract_from_urls():
+    """测试异步批量URL提取（使用本地 aiohttp 服务，不访问外网）"""
+    # 在 pytest 下缺少 aiohttp 时标记为跳过，而不是算作通过
+    if "pytest" in sys.modules:
+        import pytest
+        pytest.importorskip("aiohttp")
+    try:
+        from aiohttp import web, ClientResponseError
+        from aiohttp.test_utils import TestServer
+    except ImportError:
+        print("- 未安装 aiohttp，跳过异步URL提取测试")
+        return
+    from fast_readability import aextract_from_url, aextract_from_urls
+    
+    async def handle_ok(request):
+        return web.Response(text=URL_HTML, content_type="text/html")
+    
+    app = web.Application()
+    app.router.add_get("/ok", handle_ok)
+    
+    async def run():
+        async with TestServer(app) as server:
+            single = await aextract_from_url(str(server.make_url("/ok")))
+            batch = await aextract_from_urls([
+                str(server.make_url("/ok")),
+                str(server.make_url("/missing")),
+                str(server.make_url("/ok")),
+            ])
+        return single, batch
+    
+    single, batch = asyncio.run(run())
+    
+    assert single.get('title') == "URL测试", "异步URL提取失败"
+    assert [r.get('title') for r in (batch[0], batch[2])] == ["URL测试", "URL测试"], "失败的URL影响了其他结果"
+    assert isinstance(batch[1], ClientResponseError) and batch[1].status == 404, "失败的URL应返回对应异常"
+    print("✓ 异步URL提取成功")
+
+
+# 按顺序执行的测试；直接运行本文件时由 main() 调用
+TESTS = [
+    test_import,
+    test_basic_functionality,
+    test_utility_functions,
+    test_get_title,
+    test_get_text_content,
+    test_is_probably_readable,
+    test_invalid_html,
+    test_result_cache,
+    test_memory_limit,
+    test_context_pool,
+    test_context_pool_thread_affinity,
+    test_extract_many,
+    test_extract_from_url,
+    test_aextract_from_urls,
+]
+
 
 def main():
     """主测试函数"""
@@ -85,18 +349,15 @@ def main():
     
     all_passed = True
     
-    # 测试导入
-    if not test_import():
-        all_passed = False
-        return
-    
-    # 测试基本功能
-    if not test_basic_functionality():
-        all_passed = False
-    
-    # 测试实用函数
-    if not test_utility_functions():
-        all_passed = False
+    for test in TESTS:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} 失败: {e}")
+            all_passed = False
+            # 导入失败时其余测试没有意义
+            if test is test_import:
+                break
     
     print("\n" + "=" * 40)
     if all_passed:
@@ -106,4 +367,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()